@@ -12,29 +12,78 @@ This orchestrator implements fully autonomous deployment decisions with:
 """
 
 import asyncio
-import json
+import atexit
+import bisect
+import copy
+import functools
 import yaml
 import logging
+import logging.handlers
+import numpy as np
+import orjson
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from enum import Enum
+import queue
+import re
+import sys
+import time
+from collections import Counter, deque
+from datetime import timedelta
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntFlag
+from types import CodeType
 import subprocess
-import requests
+import httpx
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/var/log/autonomous-deployment.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Configure logging; records are queued and written by a listener thread
+# so file and console I/O never block the event loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('/var/log/autonomous-deployment.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configurations keyed by absolute path, invalidated when the file's
+# nanosecond mtime or size changes
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Boolean keywords used by autonomous_decisions rule conditions
+_RULE_OPERATORS = {"AND": "and", "OR": "or", "NOT": "not"}
+_RULE_OPERATOR_PATTERN = re.compile(r"\b(AND|OR|NOT)\b")
+
+# Last formatted deployment timestamp as (epoch second, stamp)
+_DEPLOYMENT_STAMP: Tuple[int, str] = (-1, "")
+
+
+def _deployment_timestamp() -> str:
+    """Return the local YYYYmmdd-HHMMSS stamp, formatting at most once per second"""
+    global _DEPLOYMENT_STAMP
+    now = int(time.time())
+    if _DEPLOYMENT_STAMP[0] != now:
+        _DEPLOYMENT_STAMP = (now, time.strftime('%Y%m%d-%H%M%S', time.localtime(now)))
+    return _DEPLOYMENT_STAMP[1]
+
 class DeploymentStage(Enum):
     VALIDATION = "validation"
     BUILD = "build"
@@ -45,6 +94,11 @@ class DeploymentStage(Enum):
     MONITORING = "monitoring"
     ROLLBACK = "rollback"
 
+# Names used for each stage in the deployment_pipeline config section
+_STAGE_CONFIG_NAMES = {
+    stage: stage.value.replace("deploy_", "deploy-") for stage in DeploymentStage
+}
+
 class DeploymentStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -58,7 +112,29 @@ class RiskLevel(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
+class RiskFlag(IntFlag):
+    LOW_COVERAGE = 1
+    SECURITY_VULNERABILITIES = 2
+    HIGH_ERROR_RATE = 4
+    LOW_AVAILABILITY = 8
+
+# Shared (interned) risk factor label for each risk flag, in reporting order
+_RISK_FACTOR_LABELS = (
+    (RiskFlag.LOW_COVERAGE, sys.intern("Low test coverage")),
+    (RiskFlag.SECURITY_VULNERABILITIES, sys.intern("Security vulnerabilities present")),
+    (RiskFlag.HIGH_ERROR_RATE, sys.intern("High error rate")),
+    (RiskFlag.LOW_AVAILABILITY, sys.intern("Low availability"))
+)
+
+# Mitigation strategy for each risk flag, in reporting order
+_MITIGATION_STRATEGIES = (
+    (RiskFlag.LOW_COVERAGE, "Increase test coverage before deployment"),
+    (RiskFlag.SECURITY_VULNERABILITIES, "Fix all security vulnerabilities"),
+    (RiskFlag.HIGH_ERROR_RATE, "Investigate and fix error causes"),
+    (RiskFlag.LOW_AVAILABILITY, "Improve system reliability")
+)
+
+@dataclass(frozen=True, slots=True)
 class QualityMetrics:
     test_coverage: float
     code_quality_score: float
@@ -67,7 +143,7 @@ class QualityMetrics:
     reliability_score: float
     maintainability_score: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     response_time_p95: float
     throughput: int
@@ -76,7 +152,7 @@ class PerformanceMetrics:
     memory_utilization: float
     availability: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SecurityAssessment:
     vulnerability_count: int
     security_score: float
@@ -85,25 +161,32 @@ class SecurityAssessment:
     quantum_security_enabled: bool
     zero_trust_validated: bool
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskAssessment:
     overall_risk_score: float
     risk_level: RiskLevel
-    risk_factors: List[str]
-    mitigation_strategies: List[str]
-    confidence_score: float
-    predictive_analysis: Dict[str, Any]
+    risk_factors: Tuple[str, ...]
+    mitigation_strategies: Tuple[str, ...]
+    
+    # Derived on access; most consumers only read the risk level
+    @property
+    def confidence_score(self) -> float:
+        return 0.85
+    
+    @property
+    def predictive_analysis(self) -> Dict[str, Any]:
+        return {"failure_probability": self.overall_risk_score * 0.8}
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeploymentDecision:
     decision: str  # "approve", "reject", "conditional"
     confidence: float
-    reasoning: List[str]
-    conditions: List[str]
-    recommended_actions: List[str]
+    reasoning: Tuple[str, ...]
+    conditions: Tuple[str, ...]
+    recommended_actions: Tuple[str, ...]
     autonomous_execution: bool
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeploymentContext:
     environment: str
     application_version: str
@@ -114,11 +197,46 @@ class DeploymentContext:
     risk_assessment: RiskAssessment
     historical_data: Dict[str, Any]
 
+@dataclass(slots=True)
+class MetricsSnapshot:
+    timestamp_ns: int = 0
+    application_metrics: Dict[str, Any] = field(default_factory=dict)
+    infrastructure_metrics: Dict[str, Any] = field(default_factory=dict)
+    business_metrics: Dict[str, Any] = field(default_factory=dict)
+
 class AutonomousDeploymentOrchestrator:
     """
     AI-powered autonomous deployment orchestrator with quantum-enhanced security
     """
     
+    # Ordered deployment stages per target environment
+    _STAGE_PLAN = {
+        "development": (
+            DeploymentStage.VALIDATION,
+            DeploymentStage.BUILD,
+            DeploymentStage.TEST,
+            DeploymentStage.DEPLOY_DEV,
+            DeploymentStage.MONITORING
+        ),
+        "staging": (
+            DeploymentStage.VALIDATION,
+            DeploymentStage.BUILD,
+            DeploymentStage.TEST,
+            DeploymentStage.DEPLOY_DEV,
+            DeploymentStage.DEPLOY_STAGING,
+            DeploymentStage.MONITORING
+        ),
+        "production": (
+            DeploymentStage.VALIDATION,
+            DeploymentStage.BUILD,
+            DeploymentStage.TEST,
+            DeploymentStage.DEPLOY_DEV,
+            DeploymentStage.DEPLOY_STAGING,
+            DeploymentStage.DEPLOY_PRODUCTION,
+            DeploymentStage.MONITORING
+        )
+    }
+    
     def __init__(self, config_path: str = "deployment/autonomous-deployment-system.yml"):
         self.config_path = config_path
         self.config = self._load_config()
@@ -126,45 +244,90 @@ class AutonomousDeploymentOrchestrator:
         self.quantum_security = QuantumSecurityValidator(self.config)
         self.risk_analyzer = RiskAnalyzer(self.config)
         self.performance_predictor = PerformancePredictorAI(self.config)
-        self.deployment_history = DeploymentHistoryTracker()
+        history_config = self.config.get("deployment_history", {})
+        self.deployment_history = DeploymentHistoryTracker(
+            history_config.get("path"), history_config.get("max_recent", 1024)
+        )
         
         # Initialize monitoring
         self.metrics_collector = MetricsCollector()
         self.anomaly_detector = AnomalyDetector()
         
+        # Shared async HTTP pool for metric, scanner and notification probes
+        self._http = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        
+        # Stage handlers; the deploy stages share one handler bound to their stage
+        self._stage_dispatch = {
+            DeploymentStage.VALIDATION: self._execute_validation_stage,
+            DeploymentStage.BUILD: self._execute_build_stage,
+            DeploymentStage.TEST: self._execute_test_stage,
+            DeploymentStage.MONITORING: self._setup_monitoring
+        }
+        for stage in (
+            DeploymentStage.DEPLOY_DEV,
+            DeploymentStage.DEPLOY_STAGING,
+            DeploymentStage.DEPLOY_PRODUCTION
+        ):
+            self._stage_dispatch[stage] = functools.partial(self._execute_deploy_stage, stage)
+        
         logger.info("Autonomous Deployment Orchestrator initialized")
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load deployment configuration"""
+        """Load deployment configuration, reusing a cached parse if unchanged"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            logger.info(f"Configuration loaded from {self.config_path}")
-            return config
+            path = os.path.abspath(self.config_path)
+            st = os.stat(path)
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == signature:
+                return copy.deepcopy(cached[1])
+            
+            with open(path, 'r') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
+            _CONFIG_CACHE[path] = (signature, config)
+            logger.info("Configuration loaded from %s", self.config_path)
+            return copy.deepcopy(config)
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             raise
     
+    @functools.cached_property
+    def _stage_conf_index(self) -> Dict[str, Dict[str, Any]]:
+        """Pipeline stage configs by name, built on first stage execution"""
+        return {s["name"]: s for s in self.config["deployment_pipeline"]["stages"]}
+    
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections"""
+        await self._http.aclose()
+    
     async def orchestrate_deployment(self, deployment_request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main orchestration method that handles the entire deployment lifecycle
         """
-        deployment_id = f"deploy-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        logger.info(f"Starting autonomous deployment orchestration: {deployment_id}")
+        deployment_id = f"deploy-{_deployment_timestamp()}"
+        started = time.monotonic()
+        logger.info("Starting autonomous deployment orchestration: %s", deployment_id)
         
         try:
             # 1. Gather comprehensive context
             context = await self._gather_deployment_context(deployment_request)
             
-            # 2. Perform AI-powered risk analysis
-            risk_assessment = await self.risk_analyzer.analyze_deployment_risk(context)
-            context.risk_assessment = risk_assessment
+            # 2. Perform AI-powered risk analysis alongside performance prediction;
+            #    both depend only on the gathered context
+            risk_assessment, predicted_performance = await asyncio.gather(
+                self.risk_analyzer.analyze_deployment_risk(context),
+                self.performance_predictor.predict_performance(context)
+            )
+            context = replace(context, risk_assessment=risk_assessment)
             
             # 3. AI Decision Engine - Determine if deployment should proceed
             deployment_decision = await self.ai_engine.make_deployment_decision(context)
             
-            logger.info(f"AI Deployment Decision: {deployment_decision.decision} "
-                       f"(confidence: {deployment_decision.confidence:.3f})")
+            logger.info("AI Deployment Decision: %s (confidence: %.3f)",
+                       deployment_decision.decision, deployment_decision.confidence)
             
             # 4. Execute deployment based on AI decision
             if deployment_decision.decision == "approve" and deployment_decision.autonomous_execution:
@@ -180,18 +343,21 @@ class AutonomousDeploymentOrchestrator:
             
             # 5. Record deployment outcome for future learning
             await self.deployment_history.record_deployment(
-                deployment_id, context, deployment_decision, result
+                deployment_id, context, deployment_decision, result,
+                duration_s=time.monotonic() - started
             )
             
             return {
                 "deployment_id": deployment_id,
                 "decision": deployment_decision,
                 "result": result,
-                "context": asdict(context)
+                "predicted_performance": predicted_performance,
+                # Serialized only by callers that need it, like the decision
+                "context": context
             }
             
         except Exception as e:
-            logger.error(f"Deployment orchestration failed: {e}")
+            logger.error("Deployment orchestration failed: %s", e)
             return {
                 "deployment_id": deployment_id,
                 "status": "error",
@@ -203,17 +369,18 @@ class AutonomousDeploymentOrchestrator:
         
         logger.info("Gathering deployment context...")
         
-        # Collect quality metrics
-        quality_metrics = await self._collect_quality_metrics(request)
-        
-        # Collect performance metrics
-        performance_metrics = await self._collect_performance_metrics(request)
-        
-        # Perform security assessment
-        security_assessment = await self.quantum_security.perform_security_assessment(request)
-        
-        # Gather historical data
-        historical_data = await self.deployment_history.get_relevant_history(request)
+        # Quality, performance, security and history probes are independent
+        (
+            quality_metrics,
+            performance_metrics,
+            security_assessment,
+            historical_data
+        ) = await asyncio.gather(
+            self._collect_quality_metrics(request),
+            self._collect_performance_metrics(request),
+            self.quantum_security.perform_security_assessment(request),
+            self.deployment_history.get_relevant_history(request)
+        )
         
         context = DeploymentContext(
             environment=request.get("environment", "production"),
@@ -222,7 +389,7 @@ class AutonomousDeploymentOrchestrator:
             quality_metrics=quality_metrics,
             performance_metrics=performance_metrics,
             security_assessment=security_assessment,
-            risk_assessment=RiskAssessment(0, RiskLevel.LOW, [], [], 0, {}),  # Will be filled later
+            risk_assessment=RiskAssessment(0, RiskLevel.LOW, (), ()),  # Will be filled later
             historical_data=historical_data
         )
         
@@ -233,13 +400,29 @@ class AutonomousDeploymentOrchestrator:
         logger.info("Collecting quality metrics...")
         
         # Simulate quality metric collection (in real implementation, integrate with SonarQube, etc.)
+        (
+            test_coverage,
+            code_quality_score,
+            security_vulnerabilities,
+            performance_score,
+            reliability_score,
+            maintainability_score
+        ) = await asyncio.gather(
+            self._get_test_coverage(),
+            self._get_code_quality_score(),
+            self._get_security_vulnerability_count(),
+            self._get_performance_score(),
+            self._get_reliability_score(),
+            self._get_maintainability_score()
+        )
+        
         return QualityMetrics(
-            test_coverage=await self._get_test_coverage(),
-            code_quality_score=await self._get_code_quality_score(),
-            security_vulnerabilities=await self._get_security_vulnerability_count(),
-            performance_score=await self._get_performance_score(),
-            reliability_score=await self._get_reliability_score(),
-            maintainability_score=await self._get_maintainability_score()
+            test_coverage=test_coverage,
+            code_quality_score=code_quality_score,
+            security_vulnerabilities=security_vulnerabilities,
+            performance_score=performance_score,
+            reliability_score=reliability_score,
+            maintainability_score=maintainability_score
         )
     
     async def _collect_performance_metrics(self, request: Dict[str, Any]) -> PerformanceMetrics:
@@ -247,13 +430,29 @@ class AutonomousDeploymentOrchestrator:
         logger.info("Collecting performance metrics...")
         
         # In real implementation, collect from monitoring systems
+        (
+            response_time_p95,
+            throughput,
+            error_rate,
+            cpu_utilization,
+            memory_utilization,
+            availability
+        ) = await asyncio.gather(
+            self._get_response_time_p95(),
+            self._get_current_throughput(),
+            self._get_error_rate(),
+            self._get_cpu_utilization(),
+            self._get_memory_utilization(),
+            self._get_availability()
+        )
+        
         return PerformanceMetrics(
-            response_time_p95=await self._get_response_time_p95(),
-            throughput=await self._get_current_throughput(),
-            error_rate=await self._get_error_rate(),
-            cpu_utilization=await self._get_cpu_utilization(),
-            memory_utilization=await self._get_memory_utilization(),
-            availability=await self._get_availability()
+            response_time_p95=response_time_p95,
+            throughput=throughput,
+            error_rate=error_rate,
+            cpu_utilization=cpu_utilization,
+            memory_utilization=memory_utilization,
+            availability=availability
         )
     
     async def _execute_autonomous_deployment(
@@ -265,30 +464,15 @@ class AutonomousDeploymentOrchestrator:
         
         logger.info("Executing autonomous deployment...")
         
-        deployment_stages = [
-            DeploymentStage.VALIDATION,
-            DeploymentStage.BUILD,
-            DeploymentStage.TEST,
-        ]
-        
-        # Add environment-specific stages
-        if context.environment == "development":
-            deployment_stages.append(DeploymentStage.DEPLOY_DEV)
-        elif context.environment == "staging":
-            deployment_stages.extend([DeploymentStage.DEPLOY_DEV, DeploymentStage.DEPLOY_STAGING])
-        else:  # production
-            deployment_stages.extend([
-                DeploymentStage.DEPLOY_DEV,
-                DeploymentStage.DEPLOY_STAGING,
-                DeploymentStage.DEPLOY_PRODUCTION
-            ])
-        
-        deployment_stages.append(DeploymentStage.MONITORING)
+        # Unknown environments get the full production pipeline
+        deployment_stages = self._STAGE_PLAN.get(
+            context.environment, self._STAGE_PLAN["production"]
+        )
         
         results = {}
         
         for stage in deployment_stages:
-            logger.info(f"Executing deployment stage: {stage.value}")
+            logger.info("Executing deployment stage: %s", stage.value)
             
             try:
                 stage_result = await self._execute_deployment_stage(stage, context)
@@ -300,7 +484,7 @@ class AutonomousDeploymentOrchestrator:
                 )
                 
                 if not stage_success:
-                    logger.warning(f"Stage {stage.value} failed validation, initiating rollback")
+                    logger.warning("Stage %s failed validation, initiating rollback", stage.value)
                     await self._initiate_intelligent_rollback(context, results)
                     return {
                         "status": "failed",
@@ -314,7 +498,7 @@ class AutonomousDeploymentOrchestrator:
                     await self._continuous_production_monitoring(context)
                 
             except Exception as e:
-                logger.error(f"Stage {stage.value} execution failed: {e}")
+                logger.error("Stage %s execution failed: %s", stage.value, e)
                 await self._initiate_intelligent_rollback(context, results)
                 return {
                     "status": "error",
@@ -338,28 +522,16 @@ class AutonomousDeploymentOrchestrator:
     ) -> Dict[str, Any]:
         """Execute a specific deployment stage"""
         
-        stage_config = self.config["deployment_pipeline"]["stages"]
-        stage_name = stage.value.replace("deploy_", "deploy-")
-        
         # Find stage configuration
-        stage_conf = next((s for s in stage_config if s["name"] == stage_name), None)
+        stage_conf = self._stage_conf_index.get(_STAGE_CONFIG_NAMES[stage])
         if not stage_conf:
             raise ValueError(f"Stage configuration not found for {stage.value}")
         
-        results = {}
+        handler = self._stage_dispatch.get(stage)
+        if handler is None:
+            return {}
         
-        if stage == DeploymentStage.VALIDATION:
-            results = await self._execute_validation_stage(context)
-        elif stage == DeploymentStage.BUILD:
-            results = await self._execute_build_stage(context)
-        elif stage == DeploymentStage.TEST:
-            results = await self._execute_test_stage(context)
-        elif stage in [DeploymentStage.DEPLOY_DEV, DeploymentStage.DEPLOY_STAGING, DeploymentStage.DEPLOY_PRODUCTION]:
-            results = await self._execute_deploy_stage(stage, context)
-        elif stage == DeploymentStage.MONITORING:
-            results = await self._setup_monitoring(context)
-        
-        return results
+        return await handler(context)
     
     async def _continuous_production_monitoring(self, context: DeploymentContext) -> None:
         """Continuous monitoring during production deployment"""
@@ -370,10 +542,15 @@ class AutonomousDeploymentOrchestrator:
         check_interval = 10  # 10 seconds
         
         for i in range(0, monitoring_duration, check_interval):
-            await asyncio.sleep(check_interval)
+            # Collect real-time metrics, overlapping the probe with the interval
+            metrics_task = asyncio.create_task(self._collect_realtime_metrics())
+            try:
+                await asyncio.sleep(check_interval)
+            except asyncio.CancelledError:
+                metrics_task.cancel()
+                raise
             
-            # Collect real-time metrics
-            current_metrics = await self._collect_realtime_metrics()
+            current_metrics = await metrics_task
             
             # AI-powered anomaly detection
             anomaly_detected = await self.anomaly_detector.detect_anomaly(
@@ -408,7 +585,7 @@ class AutonomousDeploymentOrchestrator:
             context, partial_results
         )
         
-        logger.info(f"Selected rollback strategy: {rollback_strategy['strategy']}")
+        logger.info("Selected rollback strategy: %s", rollback_strategy['strategy'])
         
         if rollback_strategy["strategy"] == "immediate":
             await self._execute_immediate_rollback(context)
@@ -516,7 +693,7 @@ class AutonomousDeploymentOrchestrator:
     
     async def _execute_targeted_rollback(self, context: DeploymentContext, targets: List[str]) -> None:
         """Execute targeted rollback"""
-        logger.info(f"Executing targeted rollback for: {targets}")
+        logger.info("Executing targeted rollback for: %s", targets)
     
     async def _notify_rollback_completion(self, context: DeploymentContext, strategy: Dict[str, Any]) -> None:
         """Notify stakeholders about rollback completion"""
@@ -535,16 +712,74 @@ class AutonomousDeploymentOrchestrator:
 class AIDeploymentEngine:
     """AI Engine for deployment decision making"""
     
+    # Weights for test coverage, code quality, security, performance, reliability
+    _QUALITY_WEIGHTS = (0.25, 0.25, 0.25, 0.125, 0.125)
+    _QUALITY_WEIGHT_VECTOR = np.array(_QUALITY_WEIGHTS)
+    
+    # Cheap quality gate checked before any further analysis. The
+    # vulnerability limit comes from the pipeline's quality_gates and falls
+    # back to the same zero-tolerance default when none is configured
+    _MIN_QUALITY_SCORE = 0.5
+    _DEFAULT_MAX_SECURITY_VULNERABILITIES = 0
+    # Gate rejections are policy, not a scored judgement
+    _QUALITY_GATE_CONFIDENCE = 1.0
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.decision_history = []
     
+    @functools.cached_property
+    def _approval_rules(self) -> List[Tuple[Dict[str, Any], CodeType]]:
+        """Approval rules with compiled conditions, built on first decision"""
+        decision_rules = self.config.get("autonomous_decisions", {}).get("deployment_approval", [])
+        return [
+            (rule, self._compile_rule_condition(rule["condition"]))
+            for rule in decision_rules
+        ]
+    
+    @functools.cached_property
+    def _max_security_vulnerabilities(self) -> int:
+        """Vulnerability limit from the first pipeline task that gates on it"""
+        stages = self.config.get("deployment_pipeline", {}).get("stages", [])
+        for stage in stages:
+            for task in stage.get("tasks", []):
+                gates = task.get("quality_gates", {})
+                if "vulnerabilities" in gates:
+                    return gates["vulnerabilities"]
+        return self._DEFAULT_MAX_SECURITY_VULNERABILITIES
+    
     async def make_deployment_decision(self, context: DeploymentContext) -> DeploymentDecision:
         """Make AI-powered deployment decision"""
         
         # Analyze quality metrics
         quality_score = self._calculate_quality_score(context.quality_metrics)
         
+        # Reject obvious failures without scoring performance, security and risk
+        failed_gates = []
+        recommended_actions = []
+        if quality_score < self._MIN_QUALITY_SCORE:
+            failed_gates.append(
+                f"Quality gate failed: quality score {quality_score:.3f} "
+                f"below {self._MIN_QUALITY_SCORE}"
+            )
+            recommended_actions.append("Improve test coverage")
+        vulnerabilities = context.quality_metrics.security_vulnerabilities
+        if vulnerabilities > self._max_security_vulnerabilities:
+            failed_gates.append(
+                f"Quality gate failed: {vulnerabilities} security vulnerabilities "
+                f"exceed limit of {self._max_security_vulnerabilities}"
+            )
+            recommended_actions.append("Fix security issues")
+        if failed_gates:
+            return DeploymentDecision(
+                decision="reject",
+                confidence=self._QUALITY_GATE_CONFIDENCE,
+                reasoning=tuple(failed_gates),
+                conditions=(),
+                recommended_actions=tuple(recommended_actions),
+                autonomous_execution=False
+            )
+        
         # Analyze performance metrics
         performance_score = self._calculate_performance_score(context.performance_metrics)
         
@@ -558,16 +793,31 @@ class AIDeploymentEngine:
         overall_score = (quality_score + performance_score + security_score + risk_score) / 4
         
         # Make decision based on autonomous decision rules
-        decision_rules = self.config.get("autonomous_decisions", {}).get("deployment_approval", [])
+        rule_variables = {
+            "quality_score": quality_score,
+            "performance_score": performance_score,
+            "security_score": security_score,
+            "overall_score": overall_score,
+            "test_coverage": context.quality_metrics.test_coverage,
+            "vulnerabilities": context.quality_metrics.security_vulnerabilities,
+            "change_risk_score": context.risk_assessment.overall_risk_score
+        }
         
-        for rule in decision_rules:
-            if self._evaluate_rule_condition(rule["condition"], context, overall_score):
+        # History-derived variables exist only once comparable deployments have
+        # been recorded; rules referencing them otherwise fail to evaluate
+        if context.historical_data.get("similar_deployments"):
+            rule_variables["similar_deployments_success_rate"] = (
+                context.historical_data["success_rate"] * 100
+            )
+        
+        for rule, condition in self._approval_rules:
+            if self._evaluate_rule_condition(condition, rule_variables):
                 return DeploymentDecision(
                     decision="approve",
                     confidence=rule["confidence"],
-                    reasoning=[f"Condition met: {rule['condition']}"],
-                    conditions=[],
-                    recommended_actions=[],
+                    reasoning=(f"Condition met: {rule['condition']}",),
+                    conditions=(),
+                    recommended_actions=(),
                     autonomous_execution=True
                 )
         
@@ -576,54 +826,65 @@ class AIDeploymentEngine:
             return DeploymentDecision(
                 decision="approve",
                 confidence=overall_score,
-                reasoning=["High overall quality score"],
-                conditions=[],
-                recommended_actions=[],
+                reasoning=("High overall quality score",),
+                conditions=(),
+                recommended_actions=(),
                 autonomous_execution=True
             )
         elif overall_score >= 0.7:
             return DeploymentDecision(
                 decision="conditional",
                 confidence=overall_score,
-                reasoning=["Moderate quality score, conditions required"],
-                conditions=["enhanced_monitoring", "gradual_rollout"],
-                recommended_actions=["Monitor key metrics closely"],
+                reasoning=("Moderate quality score, conditions required",),
+                conditions=("enhanced_monitoring", "gradual_rollout"),
+                recommended_actions=("Monitor key metrics closely",),
                 autonomous_execution=False
             )
         else:
             return DeploymentDecision(
                 decision="reject",
                 confidence=1.0 - overall_score,
-                reasoning=["Quality metrics below threshold"],
-                conditions=[],
-                recommended_actions=["Improve test coverage", "Fix security issues"],
+                reasoning=("Quality metrics below threshold",),
+                conditions=(),
+                recommended_actions=("Improve test coverage", "Fix security issues"),
                 autonomous_execution=False
             )
     
-    def _calculate_quality_score(self, metrics: QualityMetrics) -> float:
-        """Calculate quality score from metrics"""
-        weights = {
-            'test_coverage': 0.25,
-            'code_quality_score': 0.25,
-            'security_vulnerabilities': 0.25,
-            'performance_score': 0.125,
-            'reliability_score': 0.125
-        }
-        
-        # Normalize security vulnerabilities (fewer is better)
-        security_score = max(0, 1.0 - (metrics.security_vulnerabilities / 10))
-        
-        score = (
-            weights['test_coverage'] * (metrics.test_coverage / 100) +
-            weights['code_quality_score'] * metrics.code_quality_score +
-            weights['security_vulnerabilities'] * security_score +
-            weights['performance_score'] * metrics.performance_score +
-            weights['reliability_score'] * metrics.reliability_score
+    @staticmethod
+    def _quality_features(metrics: QualityMetrics) -> Tuple[float, ...]:
+        """Normalize quality metrics into the feature order of _QUALITY_WEIGHTS"""
+        return (
+            metrics.test_coverage / 100,
+            metrics.code_quality_score,
+            # Normalize security vulnerabilities (fewer is better)
+            max(0, 1.0 - (metrics.security_vulnerabilities / 10)),
+            metrics.performance_score,
+            metrics.reliability_score
         )
+    
+    # Score helpers are memoized on the frozen metric dataclasses; each
+    # orchestration scores fresh metrics once, so hits only come from
+    # separate deployments reporting identical metrics
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _calculate_quality_score(cls, metrics: QualityMetrics) -> float:
+        """Calculate quality score from metrics"""
+        features = cls._quality_features(metrics)
+        score = sum(w * f for w, f in zip(cls._QUALITY_WEIGHTS, features))
         
         return min(1.0, max(0.0, score))
     
-    def _calculate_performance_score(self, metrics: PerformanceMetrics) -> float:
+    def calculate_quality_scores(self, metrics: Sequence[QualityMetrics]) -> np.ndarray:
+        """Calculate quality scores for many candidates with a single matrix product"""
+        if not metrics:
+            return np.empty(0)
+        
+        features = np.array([self._quality_features(m) for m in metrics])
+        return np.clip(features @ self._QUALITY_WEIGHT_VECTOR, 0.0, 1.0)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _calculate_performance_score(metrics: PerformanceMetrics) -> float:
         """Calculate performance score from metrics"""
         # Normalize metrics (these are example thresholds)
         response_time_score = max(0, 1.0 - (metrics.response_time_p95 / 500))  # 500ms threshold
@@ -634,7 +895,9 @@ class AIDeploymentEngine:
         score = (response_time_score + throughput_score + error_rate_score + availability_score) / 4
         return min(1.0, max(0.0, score))
     
-    def _calculate_security_score(self, assessment: SecurityAssessment) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _calculate_security_score(assessment: SecurityAssessment) -> float:
         """Calculate security score from assessment"""
         base_score = assessment.security_score
         
@@ -649,10 +912,20 @@ class AIDeploymentEngine:
         
         return max(0.0, min(1.0, base_score - vulnerability_penalty))
     
-    def _evaluate_rule_condition(self, condition: str, context: DeploymentContext, overall_score: float) -> bool:
-        """Evaluate a rule condition"""
-        # Simplified rule evaluation (in real implementation, use a proper expression parser)
-        return overall_score >= 0.85  # Simplified logic
+    @staticmethod
+    def _compile_rule_condition(condition: str) -> CodeType:
+        """Compile a rule condition such as "a >= 1 AND b == 0" into bytecode"""
+        expression = _RULE_OPERATOR_PATTERN.sub(lambda m: _RULE_OPERATORS[m.group(0)], condition)
+        return compile(expression, "<rule>", "eval")
+    
+    def _evaluate_rule_condition(self, condition: CodeType, variables: Dict[str, Any]) -> bool:
+        """Evaluate a compiled rule condition"""
+        try:
+            return bool(eval(condition, {"__builtins__": {}}, variables))
+        except NameError as e:
+            # Rules referencing metrics we do not collect yet never match
+            logger.debug("Rule condition not evaluable: %s", e)
+            return False
     
     async def validate_stage_success(
         self, 
@@ -696,176 +969,365 @@ class QuantumSecurityValidator:
         """Perform quantum-enhanced security assessment"""
         
         # Simulate quantum security validation
-        vulnerability_count = await self._scan_vulnerabilities()
-        security_score = await self._calculate_security_score()
-        compliance_score = await self._check_compliance()
+        scan = await self._run_security_scan()
+        vulnerability_count = scan["vulnerability_count"]
         
         return SecurityAssessment(
             vulnerability_count=vulnerability_count,
-            security_score=security_score,
-            compliance_score=compliance_score,
+            security_score=scan["security_score"],
+            compliance_score=scan["compliance_score"],
             threat_level=RiskLevel.LOW if vulnerability_count == 0 else RiskLevel.MEDIUM,
             quantum_security_enabled=True,
             zero_trust_validated=True
         )
     
-    async def _scan_vulnerabilities(self) -> int:
-        """Scan for security vulnerabilities"""
-        return 0  # Simulated perfect security
-    
-    async def _calculate_security_score(self) -> float:
-        """Calculate security score"""
-        return 0.95  # High security score
-    
-    async def _check_compliance(self) -> float:
-        """Check compliance score"""
-        return 0.98  # High compliance score
+    async def _run_security_scan(self) -> Dict[str, Any]:
+        """Run a single scanner pass reporting vulnerabilities, security and compliance"""
+        # In real implementation, invoke the scanner once and parse its JSON report
+        return {
+            "vulnerability_count": 0,  # Simulated perfect security
+            "security_score": 0.95,  # High security score
+            "compliance_score": 0.98  # High compliance score
+        }
 
 
 class RiskAnalyzer:
     """AI-powered risk analysis engine"""
     
+    # Risk scores at or above each boundary move up one level
+    _RISK_LEVEL_BOUNDARIES = (0.4, 0.7)
+    _RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)
+    _RISK_LEVEL_BINS = np.array(_RISK_LEVEL_BOUNDARIES)
+    _RISK_LEVEL_LUT = np.array(_RISK_LEVELS, dtype=object)
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
     
     async def analyze_deployment_risk(self, context: DeploymentContext) -> RiskAssessment:
         """Analyze deployment risk using AI"""
         
-        risk_factors = []
+        risk_flags = RiskFlag(0)
         risk_score = 0.0
         
         # Analyze quality metrics risk
         if context.quality_metrics.test_coverage < 80:
-            risk_factors.append("Low test coverage")
+            risk_flags |= RiskFlag.LOW_COVERAGE
             risk_score += 0.2
         
         if context.quality_metrics.security_vulnerabilities > 0:
-            risk_factors.append("Security vulnerabilities present")
+            risk_flags |= RiskFlag.SECURITY_VULNERABILITIES
             risk_score += 0.3
         
         # Analyze performance metrics risk
         if context.performance_metrics.error_rate > 0.5:
-            risk_factors.append("High error rate")
+            risk_flags |= RiskFlag.HIGH_ERROR_RATE
             risk_score += 0.2
         
         if context.performance_metrics.availability < 99.5:
-            risk_factors.append("Low availability")
+            risk_flags |= RiskFlag.LOW_AVAILABILITY
             risk_score += 0.15
         
-        # Determine risk level
-        if risk_score >= 0.7:
-            risk_level = RiskLevel.HIGH
-        elif risk_score >= 0.4:
-            risk_level = RiskLevel.MEDIUM
-        else:
-            risk_level = RiskLevel.LOW
-        
         return RiskAssessment(
             overall_risk_score=risk_score,
-            risk_level=risk_level,
-            risk_factors=risk_factors,
-            mitigation_strategies=self._generate_mitigation_strategies(risk_factors),
-            confidence_score=0.85,
-            predictive_analysis={"failure_probability": risk_score * 0.8}
+            risk_level=self.classify_risk(risk_score),
+            risk_factors=tuple(label for flag, label in _RISK_FACTOR_LABELS if risk_flags & flag),
+            mitigation_strategies=self._generate_mitigation_strategies(risk_flags)
         )
     
-    def _generate_mitigation_strategies(self, risk_factors: List[str]) -> List[str]:
+    @classmethod
+    def classify_risk(cls, risk_score: float) -> RiskLevel:
+        """Map a single risk score to its risk level"""
+        return cls._RISK_LEVELS[bisect.bisect_right(cls._RISK_LEVEL_BOUNDARIES, risk_score)]
+    
+    @classmethod
+    def classify_risk_batch(cls, risk_scores: np.ndarray) -> np.ndarray:
+        """Map an array of risk scores to an object array of risk levels"""
+        indices = np.searchsorted(cls._RISK_LEVEL_BINS, risk_scores, side="right")
+        return cls._RISK_LEVEL_LUT[indices]
+    
+    def _generate_mitigation_strategies(self, risk_flags: RiskFlag) -> Tuple[str, ...]:
         """Generate mitigation strategies for identified risks"""
-        strategies = []
-        
-        if "Low test coverage" in risk_factors:
-            strategies.append("Increase test coverage before deployment")
-        
-        if "Security vulnerabilities present" in risk_factors:
-            strategies.append("Fix all security vulnerabilities")
-        
-        if "High error rate" in risk_factors:
-            strategies.append("Investigate and fix error causes")
-        
-        if "Low availability" in risk_factors:
-            strategies.append("Improve system reliability")
-        
-        return strategies
+        return tuple(strategy for flag, strategy in _MITIGATION_STRATEGIES if risk_flags & flag)
 
 
 class PerformancePredictorAI:
     """AI-powered performance prediction"""
     
+    # Expected effect of a deployment, shared by scalar and batch predictions
+    _RESPONSE_TIME_FACTOR = 0.95  # Slight improvement
+    _THROUGHPUT_FACTOR = 1.05  # Slight increase
+    _ERROR_RATE_FACTOR = 0.8  # Improvement
+    _MIN_ERROR_RATE = 0.01
+    _AVAILABILITY_GAIN = 0.1
+    _MAX_AVAILABILITY = 99.99
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
     
     async def predict_performance(self, context: DeploymentContext) -> Dict[str, Any]:
         """Predict post-deployment performance using AI"""
         
-        # Simplified performance prediction
         current_perf = context.performance_metrics
         
+        # Quantize inputs so near-identical baselines share a cached prediction
+        fingerprint = (
+            round(current_perf.response_time_p95, 1),
+            round(current_perf.throughput, 0),
+            round(current_perf.error_rate, 3),
+            round(current_perf.availability, 2)
+        )
+        response_time_p95, throughput, error_rate, availability = self._predict_cached(fingerprint)
+        
         predicted_metrics = {
-            "response_time_p95": current_perf.response_time_p95 * 0.95,  # Slight improvement
-            "throughput": current_perf.throughput * 1.05,  # Slight increase
-            "error_rate": max(0.01, current_perf.error_rate * 0.8),  # Improvement
-            "availability": min(99.99, current_perf.availability + 0.1)
+            "response_time_p95": response_time_p95,
+            "throughput": throughput,
+            "error_rate": error_rate,
+            "availability": availability
         }
         
         return predicted_metrics
+    
+    def predict_performance_batch(
+        self, 
+        response_times_p95: np.ndarray, 
+        throughputs: np.ndarray, 
+        error_rates: np.ndarray, 
+        availabilities: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Predict post-deployment performance for many services or regions at once"""
+        cls = type(self)
+        return {
+            "response_time_p95": np.asarray(response_times_p95) * cls._RESPONSE_TIME_FACTOR,
+            "throughput": np.asarray(throughputs) * cls._THROUGHPUT_FACTOR,
+            "error_rate": np.clip(
+                np.asarray(error_rates) * cls._ERROR_RATE_FACTOR, cls._MIN_ERROR_RATE, None
+            ),
+            "availability": np.clip(
+                np.asarray(availabilities) + cls._AVAILABILITY_GAIN, None, cls._MAX_AVAILABILITY
+            )
+        }
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _predict_cached(
+        cls, 
+        fingerprint: Tuple[float, float, float, float]
+    ) -> Tuple[float, float, float, float]:
+        """Predict metrics for a quantized performance fingerprint"""
+        response_time_p95, throughput, error_rate, availability = fingerprint
+        
+        # Simplified performance prediction
+        return (
+            response_time_p95 * cls._RESPONSE_TIME_FACTOR,
+            throughput * cls._THROUGHPUT_FACTOR,
+            max(cls._MIN_ERROR_RATE, error_rate * cls._ERROR_RATE_FACTOR),
+            min(cls._MAX_AVAILABILITY, availability + cls._AVAILABILITY_GAIN)
+        )
 
 
 class DeploymentHistoryTracker:
     """Track and analyze deployment history"""
     
-    def __init__(self):
-        self.deployment_history = []
+    # Only the last deployments to the same environment within the window
+    # are considered relevant
+    _RELEVANCE_WINDOW_NS = int(timedelta(days=30).total_seconds()) * 1_000_000_000
+    _MAX_RELEVANT = 100
+    
+    # Outcome of each status for deployments that actually executed; other
+    # statuses (e.g. rejected) count towards neither success nor failure
+    _EXECUTED_OUTCOMES = {
+        "success": True,
+        "conditional_success": True,
+        "failed": False,
+        "error": False
+    }
+    
+    def __init__(self, history_path: Optional[str] = None, max_recent: int = 1024):
+        # Every deployment is appended to the on-disk log; on start the last
+        # max_recent records are replayed into the aggregates below
+        self._history_path = history_path
+        self._max_recent = max_recent
+        self._total_recorded = 0
+        
+        # Incremental aggregates so get_relevant_history never scans history.
+        # Per environment, the executed deployments in the relevance window as
+        # (recorded_at_ns, succeeded, strategy, duration_s), plus running
+        # success counts, duration totals and per-strategy counts over them
+        self._recent_outcomes: Dict[str, Deque[Tuple[int, bool, str, float]]] = {}
+        self._recent_successes: Counter = Counter()
+        self._recent_duration_s: Counter = Counter()
+        self._similar_deployments: Counter = Counter()
+        
+        if history_path:
+            self._replay_log()
     
     async def record_deployment(
         self, 
         deployment_id: str, 
         context: DeploymentContext, 
         decision: DeploymentDecision, 
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        duration_s: float = 0.0
     ) -> None:
         """Record deployment for future learning"""
         
         record = {
             "deployment_id": deployment_id,
-            "timestamp": datetime.now().isoformat(),
-            "context": asdict(context),
-            "decision": asdict(decision),
-            "result": result
+            "recorded_at_ns": time.time_ns(),
+            "environment": context.environment,
+            "application_version": context.application_version,
+            "deployment_strategy": context.deployment_strategy,
+            "decision": decision.decision,
+            "status": result.get("status", "unknown"),
+            "risk_score": context.risk_assessment.overall_risk_score,
+            "duration_s": duration_s
         }
+        self._apply_record(record)
+        
+        # A failed write must never mask the outcome of the deployment itself
+        if self._history_path:
+            try:
+                await asyncio.to_thread(self._append_to_log, orjson.dumps(record) + b"\n")
+            except OSError as e:
+                logger.error("Failed to persist deployment %s to history log: %s", deployment_id, e)
+        
+        logger.info("Deployment recorded: %s", deployment_id)
+    
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Fold one deployment record into the relevance-window aggregates"""
+        
+        self._total_recorded += 1
+        succeeded = self._EXECUTED_OUTCOMES.get(record["status"])
+        if succeeded is None:
+            return
+        
+        environment = record["environment"]
+        strategy = record["deployment_strategy"]
+        duration_s = record["duration_s"]
+        
+        outcomes = self._recent_outcomes.setdefault(environment, deque())
+        if len(outcomes) == self._MAX_RELEVANT:
+            self._expire_oldest(environment, outcomes)
+        outcomes.append((record["recorded_at_ns"], succeeded, strategy, duration_s))
+        self._recent_successes[environment] += succeeded
+        self._recent_duration_s[environment] += duration_s
+        self._similar_deployments[(environment, strategy)] += 1
+    
+    def _expire_oldest(
+        self, 
+        environment: str, 
+        outcomes: Deque[Tuple[int, bool, str, float]]
+    ) -> None:
+        """Drop the oldest outcome of an environment from every aggregate"""
+        _, succeeded, strategy, duration_s = outcomes.popleft()
+        self._recent_successes[environment] -= succeeded
+        self._recent_duration_s[environment] -= duration_s
+        self._similar_deployments[(environment, strategy)] -= 1
+    
+    def _replay_log(self) -> None:
+        """Rebuild history from the tail of the on-disk log after a restart"""
+        
+        # Device files such as /dev/null have no history to replay
+        if not os.path.isfile(self._history_path):
+            return
         
-        self.deployment_history.append(record)
+        total = 0
+        tail: Deque[bytes] = deque(maxlen=self._max_recent)
+        try:
+            with open(self._history_path, "rb") as f:
+                for line in f:
+                    total += 1
+                    tail.append(line)
+        except OSError as e:
+            logger.error("Failed to read deployment history log: %s", e)
+            return
+        
+        for line in tail:
+            try:
+                self._apply_record(orjson.loads(line))
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning("Skipping malformed deployment history record: %s", e)
         
-        # In real implementation, persist to database
-        logger.info(f"Deployment recorded: {deployment_id}")
+        # Records before the tail still count towards the total
+        self._total_recorded += total - len(tail)
+        logger.info("Replayed %d of %d recorded deployments", len(tail), total)
+    
+    def _append_to_log(self, line: bytes) -> None:
+        """Append one serialized record to the history log"""
+        # Opened per write so no descriptor outlives the call
+        with open(self._history_path, "ab") as f:
+            f.write(line)
     
     async def get_relevant_history(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Get relevant historical deployment data"""
         
+        environment = request.get("environment", "production")
+        strategy = request.get("strategy", "blue-green")
+        
+        # Outcomes are appended in time order, so expire from the left
+        outcomes = self._recent_outcomes.get(environment)
+        cutoff_ns = time.time_ns() - self._RELEVANCE_WINDOW_NS
+        while outcomes and outcomes[0][0] < cutoff_ns:
+            self._expire_oldest(environment, outcomes)
+        
+        # Success rate, duration and similar deployments all cover the same
+        # executed deployments to this environment; without any, rate and
+        # duration are None rather than made-up figures
+        if outcomes:
+            success_rate = self._recent_successes[environment] / len(outcomes)
+            average_deployment_time = self._recent_duration_s[environment] / len(outcomes) / 60
+        else:
+            success_rate = None
+            average_deployment_time = None
+        
         # Return summarized historical data
         return {
-            "total_deployments": len(self.deployment_history),
-            "success_rate": 0.95,  # 95% success rate
-            "average_deployment_time": 25,  # 25 minutes
-            "similar_deployments": 15
+            "total_deployments": self._total_recorded,
+            "success_rate": success_rate,
+            "average_deployment_time": average_deployment_time,
+            "similar_deployments": self._similar_deployments[(environment, strategy)]
         }
 
 
 class MetricsCollector:
     """Collect metrics from various sources"""
     
-    async def collect_metrics(self) -> Dict[str, Any]:
-        """Collect comprehensive metrics"""
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "application_metrics": {},
-            "infrastructure_metrics": {},
-            "business_metrics": {}
-        }
+    def __init__(self):
+        self.snapshot = MetricsSnapshot()
+    
+    async def collect_metrics(self, out: Optional[MetricsSnapshot] = None) -> MetricsSnapshot:
+        """
+        Collect comprehensive metrics into a reused snapshot.
+        
+        The snapshot is overwritten on the next collection; copy it with
+        copy.copy() if a stable view is needed.
+        """
+        snapshot = self.snapshot if out is None else out
+        snapshot.timestamp_ns = time.time_ns()
+        snapshot.application_metrics.clear()
+        snapshot.infrastructure_metrics.clear()
+        snapshot.business_metrics.clear()
+        return snapshot
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _zscore_exceeds(current, mean, std, k):
+        """Fused per-sample check of current > mean + k * std"""
+        exceeds = np.empty(current.shape[0], dtype=np.bool_)
+        for i in range(current.shape[0]):
+            exceeds[i] = current[i] - mean[i] > k * std[i]
+        return exceeds
+else:
+    _zscore_exceeds = None
 
 
 class AnomalyDetector:
     """AI-powered anomaly detection"""
     
+    # Response times more than 50% above the baseline p95 are anomalous
+    _RESPONSE_TIME_TOLERANCE = 1.5
+    
     async def detect_anomaly(
         self, 
         current_metrics: Dict[str, Any], 
@@ -875,9 +1337,51 @@ class AnomalyDetector:
         
         # Simplified anomaly detection
         current_response_time = current_metrics.get("response_time", 0)
-        threshold = baseline_metrics.response_time_p95 * 1.5  # 50% increase threshold
+        threshold = baseline_metrics.response_time_p95 * self._RESPONSE_TIME_TOLERANCE
         
         return current_response_time > threshold
+    
+    def detect_anomalies_batch(
+        self, 
+        current_response_times: np.ndarray, 
+        baseline_metrics: PerformanceMetrics
+    ) -> np.ndarray:
+        """Flag anomalous response times across many samples in one comparison"""
+        threshold = baseline_metrics.response_time_p95 * self._RESPONSE_TIME_TOLERANCE
+        # Keep the caller's dtype so float64 samples match detect_anomaly exactly
+        return np.greater(np.asarray(current_response_times), threshold)
+    
+    def detect_anomalies_zscore(
+        self, 
+        current: np.ndarray, 
+        rolling_mean: np.ndarray, 
+        rolling_std: np.ndarray, 
+        k: float = 3.0
+    ) -> np.ndarray:
+        """
+        Flag metrics more than k rolling standard deviations above their mean.
+        
+        Rolling baselines may be kept as float16 to halve their footprint;
+        all inputs are widened to float32 only for the comparison.
+        """
+        # Broadcast up front so scalar baselines work and mismatched shapes
+        # raise ValueError on both paths, before the kernel indexes them
+        current, rolling_mean, rolling_std = np.broadcast_arrays(
+            np.asarray(current, dtype=np.float32),
+            np.asarray(rolling_mean, dtype=np.float32),
+            np.asarray(rolling_std, dtype=np.float32)
+        )
+        
+        # Compared without dividing so a zero std needs no special casing
+        if _zscore_exceeds is not None:
+            exceeds = _zscore_exceeds(
+                np.ascontiguousarray(current).ravel(),
+                np.ascontiguousarray(rolling_mean).ravel(),
+                np.ascontiguousarray(rolling_std).ravel(),
+                np.float32(k)
+            )
+            return exceeds.reshape(current.shape)
+        return current - rolling_mean > np.float32(k) * rolling_std
 
 
 async def main():
@@ -895,10 +1399,16 @@ async def main():
     }
     
     # Execute autonomous deployment
-    result = await orchestrator.orchestrate_deployment(deployment_request)
+    try:
+        result = await orchestrator.orchestrate_deployment(deployment_request)
+    finally:
+        await orchestrator.aclose()
     
-    logger.info(f"Deployment completed with result: {result['result']['status']}")
-    print(json.dumps(result, indent=2))
+    logger.info("Deployment completed with result: %s", result['result']['status'])
+    # orjson serializes the dataclasses and enums in the result natively
+    sys.stdout.buffer.write(
+        orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
 
 
 if __name__ == "__main__":
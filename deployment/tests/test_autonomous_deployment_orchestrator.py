@@ -0,0 +1,108 @@
+"""
+Tests for the autonomous deployment orchestrator.
+
+Run with: python -m unittest discover -s deployment/tests
+"""
+
+import importlib.util
+import math
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+DEPLOYMENT_DIR = Path(__file__).resolve().parent.parent
+
+# The orchestrator lives in a hyphenated script, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "autonomous_deployment_orchestrator",
+    DEPLOYMENT_DIR / "autonomous-deployment-orchestrator.py"
+)
+ado = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = ado
+_spec.loader.exec_module(ado)
+
+
+def load_config():
+    with open(DEPLOYMENT_DIR / "autonomous-deployment-system.yml") as f:
+        return yaml.load(f, Loader=ado._YAML_LOADER)
+
+
+def make_context(historical_data, risk_score=0.2):
+    """Middling candidate that no quality-based rule approves on its own"""
+    return ado.DeploymentContext(
+        environment="production",
+        application_version="4.0.0",
+        deployment_strategy="blue-green",
+        quality_metrics=ado.QualityMetrics(70, 0.6, 0, 0.5, 0.5, 0.5),
+        performance_metrics=ado.PerformanceMetrics(400, 400, 0.8, 50, 50, 99.0),
+        security_assessment=ado.SecurityAssessment(
+            0, 0.4, 0.5, ado.RiskLevel.LOW, False, False
+        ),
+        risk_assessment=ado.RiskAssessment(risk_score, ado.RiskLevel.LOW, (), ()),
+        historical_data=historical_data
+    )
+
+
+class HistoryApprovalRuleTest(unittest.IsolatedAsyncioTestCase):
+    """The similar-deployments rule only applies to recorded history"""
+
+    def setUp(self):
+        self.engine = ado.AIDeploymentEngine(load_config())
+
+    async def record(self, tracker, status):
+        context = make_context({})
+        decision = ado.DeploymentDecision("approve", 0.9, (), (), (), True)
+        await tracker.record_deployment("deploy-test", context, decision, {"status": status})
+
+    async def test_no_history_does_not_auto_approve(self):
+        tracker = ado.DeploymentHistoryTracker()
+        history = await tracker.get_relevant_history(
+            {"environment": "production", "strategy": "blue-green"}
+        )
+
+        decision = await self.engine.make_deployment_decision(make_context(history))
+
+        self.assertEqual(history["similar_deployments"], 0)
+        self.assertIsNone(history["success_rate"])
+        self.assertIsNone(history["average_deployment_time"])
+        self.assertNotEqual(decision.decision, "approve")
+        self.assertFalse(decision.autonomous_execution)
+
+    async def test_successful_history_auto_approves(self):
+        tracker = ado.DeploymentHistoryTracker()
+        for _ in range(10):
+            await self.record(tracker, "success")
+        history = await tracker.get_relevant_history(
+            {"environment": "production", "strategy": "blue-green"}
+        )
+
+        decision = await self.engine.make_deployment_decision(make_context(history))
+
+        self.assertEqual(decision.decision, "approve")
+        self.assertEqual(decision.confidence, 0.85)
+
+
+class AnomalyDetectorTest(unittest.IsolatedAsyncioTestCase):
+    """Batch and scalar anomaly checks agree"""
+
+    async def test_batch_matches_scalar_at_threshold(self):
+        detector = ado.AnomalyDetector()
+        baseline = ado.PerformanceMetrics(145.7, 1000, 0.1, 50, 50, 99.9)
+        threshold = baseline.response_time_p95 * detector._RESPONSE_TIME_TOLERANCE
+        samples = [218.55, threshold, math.nextafter(threshold, 0), 218.54]
+
+        expected = [
+            await detector.detect_anomaly({"response_time": sample}, baseline)
+            for sample in samples
+        ]
+        batch = detector.detect_anomalies_batch(np.array(samples), baseline)
+
+        self.assertTrue(expected[0])
+        self.assertEqual(batch.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()